@@ -753,6 +753,17 @@ fn compute_bundle_sync_stamp(bundle_root: &Path) -> Result<String, String> {
     ))
 }
 
+/// Write `contents` to `path` unless the file already holds exactly those bytes.
+///
+/// Used for files regenerated on every LoRA panel refresh, so an unchanged
+/// refresh leaves their mtime (and any watchers) alone.
+pub(crate) fn write_if_changed(path: &Path, contents: &str) -> std::io::Result<()> {
+    if std::fs::read(path).map_or(false, |current| current == contents.as_bytes()) {
+        return Ok(());
+    }
+    std::fs::write(path, contents)
+}
+
 fn remove_path(path: &Path) -> Result<(), String> {
     if !path.exists() {
         return Ok(());
@@ -1769,7 +1780,8 @@ fn write_carey_lora_registry(entries: &[CareyLoraEntry]) -> Result<(), String> {
 
     let json = serde_json::to_string_pretty(&payload)
         .map_err(|e| format!("Cannot serialize LoRA registry: {}", e))?;
-    std::fs::write(&path, json).map_err(|e| format!("Cannot save {}: {}", path.display(), e))?;
+    write_if_changed(&path, &json)
+        .map_err(|e| format!("Cannot save {}: {}", path.display(), e))?;
     Ok(())
 }
 
@@ -1837,7 +1849,8 @@ fn ensure_default_carey_captions(runtime_root: &Path) -> Result<(), String> {
     payload["default"] = serde_json::json!(default_pool);
     let json = serde_json::to_string_pretty(&payload)
         .map_err(|e| format!("Cannot serialize default captions: {}", e))?;
-    std::fs::write(&path, json).map_err(|e| format!("Cannot save {}: {}", path.display(), e))?;
+    write_if_changed(&path, &json)
+        .map_err(|e| format!("Cannot save {}: {}", path.display(), e))?;
 
     Ok(())
 }
@@ -2029,7 +2042,8 @@ fn write_sa3_lora_registry(entries: &[Sa3LoraEntry]) -> Result<(), String> {
 
     let json = serde_json::to_string_pretty(&payload)
         .map_err(|e| format!("Cannot serialize SA3 LoRA registry: {}", e))?;
-    std::fs::write(&path, json).map_err(|e| format!("Cannot save {}: {}", path.display(), e))?;
+    write_if_changed(&path, &json)
+        .map_err(|e| format!("Cannot save {}: {}", path.display(), e))?;
     Ok(())
 }
 
@@ -3069,6 +3083,7 @@ pub fn run() {
                     mgr.get_service_info()
                 };
                 let mut last_tray_signature = tray_menu_signature(&initial_info);
+                let mut last_info = initial_info;
 
                 loop {
                     tokio::time::sleep(std::time::Duration::from_secs(1)).await;
@@ -3076,27 +3091,18 @@ pub fn run() {
                     let mut mgr = poll_manager.lock().await;
                     mgr.check_processes();
                     let targets = mgr.take_due_health_targets(std::time::Instant::now());
+                    let info = mgr.get_service_info();
                     drop(mgr);
 
-                    for target in &targets {
-                        let url = format!("http://localhost:{}{}", target.port, target.endpoint);
-                        let healthy = match client
-                            .get(&url)
-                            .timeout(std::time::Duration::from_secs(target.timeout_seconds))
-                            .send()
-                            .await
-                        {
-                            Ok(resp) => resp.status().is_success(),
-                            Err(_) => false,
-                        };
-
-                        let mut mgr = poll_manager.lock().await;
-                        mgr.set_health(&target.id, healthy);
-                    }
+                    // Probe results are applied and emitted by the probes themselves;
+                    // the next tick picks them up for the tray menu.
+                    spawn_health_probes(&client, targets, &poll_manager, &poll_handle);
 
-                    let mgr = poll_manager.lock().await;
-                    let info = mgr.get_service_info();
-                    drop(mgr);
+                    // Most ticks change nothing; skip re-sending the full list (build
+                    // logs included) to the webview when it matches the last emit.
+                    if info == last_info {
+                        continue;
+                    }
                     let _ = poll_handle.emit("services-updated", &info);
 
                     // Only rebuild the tray menu when the visible tray state changes.
@@ -3113,6 +3119,7 @@ pub fn run() {
                         }
                         last_tray_signature = current_tray_signature;
                     }
+                    last_info = info;
                 }
             });
 
@@ -3170,6 +3177,41 @@ pub fn run() {
     }
 }
 
+/// Probe each due health endpoint on its own task and publish each result as
+/// soon as it arrives, so one slow or hung service can't hold back the
+/// others' status until its timeout expires.
+fn spawn_health_probes(
+    client: &reqwest::Client,
+    targets: Vec<service_manager::HealthTarget>,
+    manager: &ManagerState,
+    handle: &tauri::AppHandle,
+) {
+    for target in targets {
+        let client = client.clone();
+        let manager = manager.clone();
+        let handle = handle.clone();
+        tauri::async_runtime::spawn(async move {
+            let url = format!("http://localhost:{}{}", target.port, target.endpoint);
+            let healthy = match client
+                .get(&url)
+                .timeout(std::time::Duration::from_secs(target.timeout_seconds))
+                .send()
+                .await
+            {
+                Ok(resp) => resp.status().is_success(),
+                Err(_) => false,
+            };
+
+            let mut mgr = manager.lock().await;
+            if mgr.set_health(&target.id, healthy) {
+                let info = mgr.get_service_info();
+                drop(mgr);
+                let _ = handle.emit("services-updated", &info);
+            }
+        });
+    }
+}
+
 #[tauri::command]
 async fn get_services(
     manager: tauri::State<'_, ManagerState>,
@@ -3204,12 +3246,34 @@ async fn restart_service(
 ) -> Result<(), String> {
     let mut mgr = manager.lock().await;
     mgr.stop(&service_id).ok();
+    let port = mgr.service_port(&service_id);
     drop(mgr);
-    tokio::time::sleep(std::time::Duration::from_secs(1)).await;
+    // stop() already waited for the process tree to exit; only hold the
+    // restart back while the old listener is still releasing its port.
+    if let Some(port) = port {
+        wait_for_port_release(port, std::time::Duration::from_secs(5)).await;
+    }
     let mut mgr = manager.lock().await;
     mgr.start(&service_id).map_err(|e| e.to_string())
 }
 
+/// Poll until nothing accepts connections on `port`, giving up after `timeout`.
+async fn wait_for_port_release(port: u16, timeout: std::time::Duration) {
+    let deadline = std::time::Instant::now() + timeout;
+    while std::time::Instant::now() < deadline {
+        // The connect probe blocks for up to its 200ms timeout, so keep it off
+        // the async workers.
+        let accepting =
+            tauri::async_runtime::spawn_blocking(move || service_manager::port_accepting(port))
+                .await
+                .unwrap_or(false);
+        if !accepting {
+            break;
+        }
+        tokio::time::sleep(std::time::Duration::from_millis(100)).await;
+    }
+}
+
 #[tauri::command]
 async fn rebuild_env(
     service_id: String,
@@ -3230,7 +3294,7 @@ async fn rebuild_env(
     let handle = app_handle.clone();
 
     tauri::async_runtime::spawn(async move {
-        let result = run_build(build_info, mgr_clone.clone(), handle.clone()).await;
+        let result = run_build(build_info, mgr_clone.clone(), handle.clone(), None).await;
 
         let mut mgr = mgr_clone.lock().await;
         match result {
@@ -3258,32 +3322,70 @@ async fn rebuild_all_envs(
     let mgr_clone = manager.inner().clone();
     let handle = app_handle.clone();
 
-    // Run builds sequentially in a single background task,
-    // selecting each service in the UI as it starts building.
+    // Run the per-service builds concurrently. Each service has its own venv,
+    // so the only shared pieces are uv itself and uv's cache (which uv locks).
     tauri::async_runtime::spawn(async move {
-        for info in build_infos {
-            let sid = info.service_id.clone();
+        let Some(first_sid) = build_infos.first().map(|info| info.service_id.clone()) else {
+            return;
+        };
 
-            // Tell the UI to select/highlight this service
-            let _ = handle.emit("select-service", &sid);
+        // Tell the UI to select/highlight the first service being built
+        let _ = handle.emit("select-service", &first_sid);
 
-            {
-                let mut mgr = mgr_clone.lock().await;
+        {
+            let mut mgr = mgr_clone.lock().await;
+            for info in &build_infos {
                 let total = info.build_steps.len() + 2;
-                mgr.set_build_started(&sid, total);
+                mgr.set_build_started(&info.service_id, total);
             }
+        }
 
-            let result = run_build(info, mgr_clone.clone(), handle.clone()).await;
-
-            {
+        // Resolve (or install) uv once up front so the concurrent builds
+        // don't all race to run the uv installer. If that fails, every build
+        // fails with the same error instead of each retrying the install.
+        let uv = match ensure_uv(&first_sid, &mgr_clone, &handle).await {
+            Ok(uv) => uv,
+            Err(e) => {
                 let mut mgr = mgr_clone.lock().await;
+                for info in &build_infos {
+                    mgr.set_build_done(&info.service_id, Some(e.clone()));
+                }
+                let info = mgr.get_service_info();
+                drop(mgr);
+                let _ = handle.emit("services-updated", &info);
+                return;
+            }
+        };
+
+        // Likewise install Python 3.11 once here rather than in every build
+        // that has to create a venv.
+        if let Some(info) = build_infos.iter().find(|info| !info.env_dir.exists()) {
+            ensure_python_311(&uv, &info.work_dir, &first_sid, &mgr_clone).await;
+            emit_status(&mgr_clone, &handle).await;
+        }
+
+        let mut builds = Vec::with_capacity(build_infos.len());
+        for info in build_infos {
+            let sid = info.service_id.clone();
+            let mgr = mgr_clone.clone();
+            let handle = handle.clone();
+            let uv = uv.clone();
+
+            builds.push(tauri::async_runtime::spawn(async move {
+                let result = run_build(info, mgr.clone(), handle.clone(), Some(uv)).await;
+
+                let mut mgr = mgr.lock().await;
                 match result {
                     Ok(()) => mgr.set_build_done(&sid, None),
-                    Err(e) => mgr.set_build_done(&sid, Some(e.clone())),
+                    Err(e) => mgr.set_build_done(&sid, Some(e)),
                 }
                 let info = mgr.get_service_info();
                 let _ = handle.emit("services-updated", &info);
-            }
+            }));
+        }
+
+        for build in builds {
+            let _ = build.await;
         }
     });
 
@@ -3334,13 +3436,41 @@ async fn ensure_uv(
     manager: &Arc<Mutex<ServiceManager>>,
     handle: &tauri::AppHandle,
 ) -> Result<String, String> {
-    {
+    let cached_uv = {
         let mut mgr = manager.lock().await;
         mgr.set_build_step(service_id, 0, "Checking for uv package manager...");
-        mgr.append_build_log(service_id, "$ uv --version");
-    }
+        let cached_uv = mgr.cached_uv_path();
+        if let Some(path) = &cached_uv {
+            mgr.append_build_log(service_id, &format!("uv already resolved: {}", path));
+        } else {
+            mgr.append_build_log(service_id, "$ uv --version");
+        }
+        cached_uv
+    };
     emit_status(manager, handle).await;
 
+    // A previous build this session already probed (or installed) uv, so
+    // skip spawning `uv --version` again, e.g. once per service in Rebuild All.
+    if let Some(path) = cached_uv {
+        if path == "uv" || std::path::Path::new(&path).exists() {
+            return Ok(path);
+        }
+    }
+
+    let uv = find_or_install_uv(service_id, manager, handle).await?;
+    {
+        let mut mgr = manager.lock().await;
+        mgr.set_uv_path(&uv);
+    }
+    Ok(uv)
+}
+
+/// Probe PATH and the usual install locations for uv, installing it if needed.
+async fn find_or_install_uv(
+    service_id: &str,
+    manager: &Arc<Mutex<ServiceManager>>,
+    handle: &tauri::AppHandle,
+) -> Result<String, String> {
     // Check if uv is already on PATH
     let mut check_cmd = tokio::process::Command::new("uv");
     check_cmd.arg("--version");
@@ -3453,18 +3583,67 @@ async fn ensure_uv(
     Err("uv was installed but cannot be found. Restart the application and try again.".to_string())
 }
 
-/// Run the full build pipeline for a service
+/// Install Python 3.11 through uv unless it already succeeded this session.
+/// Failure is only logged: Python 3.11 might already be on PATH.
+async fn ensure_python_311(
+    uv: &str,
+    work_dir: &std::path::Path,
+    service_id: &str,
+    manager: &Arc<Mutex<ServiceManager>>,
+) {
+    {
+        let mut mgr = manager.lock().await;
+        if mgr.python_installed() {
+            mgr.append_build_log(service_id, "\nPython 3.11 already installed this session");
+            return;
+        }
+        mgr.append_build_log(service_id, &format!("\n$ {} python install 3.11", uv));
+    }
+
+    let py_install = run_command_streamed(
+        uv,
+        &["python", "install", "3.11"],
+        work_dir,
+        service_id,
+        manager,
+    )
+    .await;
+
+    let mut mgr = manager.lock().await;
+    match py_install {
+        Ok(()) => mgr.set_python_installed(),
+        Err(e) => {
+            mgr.append_build_log(service_id, &format!("Warning: uv python install: {}", e));
+        }
+    }
+}
+
+/// Run the full build pipeline for a service.
+///
+/// `prepared_uv` is set by Rebuild All, which resolves uv and runs the
+/// Python 3.11 install once before starting the builds concurrently; the
+/// build then skips both steps. Otherwise the build does them itself.
 async fn run_build(
     build_info: service_manager::BuildInfo,
     manager: Arc<Mutex<ServiceManager>>,
     handle: tauri::AppHandle,
+    prepared_uv: Option<String>,
 ) -> Result<(), String> {
     let service_id = build_info.service_id.clone();
     let work_dir = &build_info.work_dir;
     let env_dir = &build_info.env_dir;
 
     // Step 0: Ensure uv is available
-    let uv = ensure_uv(&service_id, &manager, &handle).await?;
+    let python_prepared = prepared_uv.is_some();
+    let uv = match prepared_uv {
+        Some(uv) => {
+            let mut mgr = manager.lock().await;
+            mgr.set_build_step(&service_id, 0, "Checking for uv package manager...");
+            mgr.append_build_log(&service_id, &format!("uv already resolved: {}", uv));
+            uv
+        }
+        None => ensure_uv(&service_id, &manager, &handle).await?,
+    };
 
     // Step 1: Create venv with uv (using Python 3.11)
     if !env_dir.exists() {
@@ -3475,24 +3654,11 @@ async fn run_build(
                 1,
                 "Installing Python 3.11 and creating venv...",
             );
-            mgr.append_build_log(&service_id, &format!("\n$ {} python install 3.11", uv));
         }
         emit_status(&manager, &handle).await;
 
-        // First ensure Python 3.11 is available via uv
-        let py_install = run_command_streamed(
-            &uv,
-            &["python", "install", "3.11"],
-            work_dir,
-            &service_id,
-            &manager,
-        )
-        .await;
-
-        if let Err(e) = py_install {
-            let mut mgr = manager.lock().await;
-            mgr.append_build_log(&service_id, &format!("Warning: uv python install: {}", e));
-            // Non-fatal — Python 3.11 might already be on PATH
+        if !python_prepared {
+            ensure_python_311(&uv, work_dir, &service_id, &manager).await;
         }
 
         // Create the venv
@@ -3505,31 +3671,15 @@ async fn run_build(
         }
         emit_status(&manager, &handle).await;
 
-        let mut venv_cmd = tokio::process::Command::new(&uv);
-        venv_cmd
-            .args(["venv", "--python", "3.11", "--seed", "env"])
-            .current_dir(work_dir);
-        hide_console_window(&mut venv_cmd);
-        let venv_output = venv_cmd
-            .output()
-            .await
-            .map_err(|e| format!("Failed to create venv: {}", e))?;
-
-        {
-            let mut mgr = manager.lock().await;
-            let stdout = String::from_utf8_lossy(&venv_output.stdout);
-            let stderr = String::from_utf8_lossy(&venv_output.stderr);
-            if !stdout.is_empty() {
-                mgr.append_build_log(&service_id, &stdout);
-            }
-            if !stderr.is_empty() {
-                mgr.append_build_log(&service_id, &stderr);
-            }
-        }
-
-        if !venv_output.status.success() {
-            return Err("Failed to create virtual environment with uv".to_string());
-        }
+        run_command_streamed(
+            &uv,
+            &["venv", "--python", "3.11", "--seed", "env"],
+            work_dir,
+            &service_id,
+            &manager,
+        )
+        .await
+        .map_err(|e| format!("Failed to create virtual environment with uv: {}", e))?;
     } else {
         let mut mgr = manager.lock().await;
         mgr.set_build_step(&service_id, 1, "Virtual environment already exists");
@@ -3627,6 +3777,7 @@ async fn run_build(
             .args(&args)
             .current_dir(work_dir)
             .env("PYTHONIOENCODING", "utf-8")
+            .stdin(std::process::Stdio::null())
             .stdout(std::process::Stdio::piped())
             .stderr(std::process::Stdio::piped());
         hide_console_window(&mut child_cmd);
@@ -3644,39 +3795,33 @@ async fn run_build(
         let sid_stdout = service_id.clone();
         let stdout_application_control_blocked = application_control_blocked.clone();
 
-        let stdout_task = tauri::async_runtime::spawn(async move {
-            if let Some(stdout) = stdout {
-                use tokio::io::{AsyncBufReadExt, BufReader};
-                let mut reader = BufReader::new(stdout).lines();
-                while let Ok(Some(line)) = reader.next_line().await {
-                    if is_windows_application_control_block(&line) {
-                        stdout_application_control_blocked
-                            .store(true, std::sync::atomic::Ordering::Relaxed);
-                    }
-                    let mut mgr = mgr_stdout.lock().await;
-                    mgr.append_build_log(&sid_stdout, &line);
+        let stdout_task = tauri::async_runtime::spawn(stream_build_log(
+            stdout,
+            sid_stdout,
+            mgr_stdout,
+            move |line| {
+                if is_windows_application_control_block(line) {
+                    stdout_application_control_blocked
+                        .store(true, std::sync::atomic::Ordering::Relaxed);
                 }
-            }
-        });
+            },
+        ));
 
         let mgr_stderr = manager.clone();
         let sid_stderr = service_id.clone();
         let stderr_application_control_blocked = application_control_blocked.clone();
 
-        let stderr_task = tauri::async_runtime::spawn(async move {
-            if let Some(stderr) = stderr {
-                use tokio::io::{AsyncBufReadExt, BufReader};
-                let mut reader = BufReader::new(stderr).lines();
-                while let Ok(Some(line)) = reader.next_line().await {
-                    if is_windows_application_control_block(&line) {
-                        stderr_application_control_blocked
-                            .store(true, std::sync::atomic::Ordering::Relaxed);
-                    }
-                    let mut mgr = mgr_stderr.lock().await;
-                    mgr.append_build_log(&sid_stderr, &line);
+        let stderr_task = tauri::async_runtime::spawn(stream_build_log(
+            stderr,
+            sid_stderr,
+            mgr_stderr,
+            move |line| {
+                if is_windows_application_control_block(line) {
+                    stderr_application_control_blocked
+                        .store(true, std::sync::atomic::Ordering::Relaxed);
                 }
-            }
-        });
+            },
+        ));
 
         let _ = stdout_task.await;
         let _ = stderr_task.await;
@@ -3729,7 +3874,7 @@ async fn run_build(
     Ok(())
 }
 
-/// Run a command and stream its output to the build log (non-fatal helper)
+/// Run a command and stream its output to the build log line by line
 async fn run_command_streamed(
     program: &str,
     args: &[&str],
@@ -3738,35 +3883,99 @@ async fn run_command_streamed(
     manager: &Arc<Mutex<ServiceManager>>,
 ) -> Result<(), String> {
     let mut cmd = tokio::process::Command::new(program);
-    cmd.args(args).current_dir(work_dir);
+    cmd.args(args)
+        .current_dir(work_dir)
+        .stdin(std::process::Stdio::null())
+        .stdout(std::process::Stdio::piped())
+        .stderr(std::process::Stdio::piped());
     hide_console_window(&mut cmd);
-    let output = cmd
-        .output()
-        .await
+    let mut child = cmd
+        .spawn()
         .map_err(|e| format!("Failed to run {} {:?}: {}", program, args, e))?;
 
-    {
-        let mut mgr = manager.lock().await;
-        let stdout = String::from_utf8_lossy(&output.stdout);
-        let stderr = String::from_utf8_lossy(&output.stderr);
-        if !stdout.is_empty() {
-            mgr.append_build_log(service_id, &stdout);
-        }
-        if !stderr.is_empty() {
-            mgr.append_build_log(service_id, &stderr);
-        }
-    }
+    let stdout_task = tauri::async_runtime::spawn(stream_build_log(
+        child.stdout.take(),
+        service_id.to_string(),
+        manager.clone(),
+        |_| {},
+    ));
+    let stderr_task = tauri::async_runtime::spawn(stream_build_log(
+        child.stderr.take(),
+        service_id.to_string(),
+        manager.clone(),
+        |_| {},
+    ));
+
+    let _ = stdout_task.await;
+    let _ = stderr_task.await;
 
-    if output.status.success() {
+    let status = child
+        .wait()
+        .await
+        .map_err(|e| format!("Failed to wait for {}: {}", program, e))?;
+
+    if status.success() {
         Ok(())
     } else {
         Err(format!(
             "Command failed with exit code {}",
-            output.status.code().unwrap_or(-1)
+            status.code().unwrap_or(-1)
         ))
     }
 }
 
+/// Append each line from a child's output pipe to the build log as it arrives.
+///
+/// Lines that are already sitting in the read buffer are appended together, so
+/// a burst of installer output takes the manager lock once per read instead of
+/// once per line. `inspect_line` sees every line before it is queued.
+async fn stream_build_log<R, F>(
+    pipe: Option<R>,
+    service_id: String,
+    manager: Arc<Mutex<ServiceManager>>,
+    mut inspect_line: F,
+) where
+    R: tokio::io::AsyncRead + Unpin,
+    F: FnMut(&str),
+{
+    const MAX_BATCH_BYTES: usize = 16 * 1024;
+
+    let Some(pipe) = pipe else {
+        return;
+    };
+    use tokio::io::{AsyncBufReadExt, BufReader};
+    let mut reader = BufReader::new(pipe);
+    let mut line = Vec::new();
+    let mut pending = String::new();
+    loop {
+        line.clear();
+        // Read raw bytes and decode lossily: a single non-UTF-8 byte (e.g. a
+        // localized Windows tool message) must not end the stream early.
+        match reader.read_until(b'\n', &mut line).await {
+            Ok(0) | Err(_) => break,
+            Ok(_) => {}
+        }
+        let bytes = line.strip_suffix(b"\n").unwrap_or(&line);
+        let bytes = bytes.strip_suffix(b"\r").unwrap_or(bytes);
+        let text = String::from_utf8_lossy(bytes);
+        inspect_line(&text);
+        if !pending.is_empty() {
+            pending.push('\n');
+        }
+        pending.push_str(&text);
+
+        // Flush once no further complete line is already buffered, so output
+        // never waits on a child that is still writing its next line.
+        if !reader.buffer().contains(&b'\n') || pending.len() >= MAX_BATCH_BYTES {
+            manager.lock().await.append_build_log(&service_id, &pending);
+            pending.clear();
+        }
+    }
+    if !pending.is_empty() {
+        manager.lock().await.append_build_log(&service_id, &pending);
+    }
+}
+
 /// Emit current service status to frontend
 async fn emit_status(manager: &Arc<Mutex<ServiceManager>>, handle: &tauri::AppHandle) {
     let mgr = manager.lock().await;
@@ -4377,6 +4586,7 @@ async fn start_carey_ace_lora_training(
     }
 
     cmd.current_dir(repo_root.join("services").join("carey"))
+        .stdin(std::process::Stdio::null())
         .stdout(std::process::Stdio::from(log_file))
         .stderr(std::process::Stdio::from(log_file_err))
         .env("PYTHONIOENCODING", "utf-8")
@@ -4808,6 +5018,7 @@ async fn start_sa3_lora_training(
             .arg(target_latent_rms.to_string());
     }
     cmd.current_dir(repo_root.join("services").join("sa3"))
+        .stdin(std::process::Stdio::null())
         .stdout(std::process::Stdio::from(log_file))
         .stderr(std::process::Stdio::from(log_file_err))
         .env("PYTHONIOENCODING", "utf-8")
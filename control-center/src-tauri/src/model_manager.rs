@@ -689,8 +689,8 @@ import sys, os, json
 os.environ['HF_HUB_DISABLE_PROGRESS_BARS'] = '1'
 os.environ['HF_HUB_DISABLE_SYMLINKS_WARNING'] = '1'
 
-from huggingface_hub import hf_hub_download, constants
-import requests, hashlib
+from huggingface_hub import hf_hub_download, hf_hub_url, get_hf_file_metadata, constants
+import requests, hashlib, re
 
 repo_id = "{repo_id}"
 filename = "{filename}"
@@ -720,29 +720,65 @@ try:
     short = filename if len(filename) < 50 else "..." + filename[-47:]
     report(0.0, f"Downloading {{short}}...")
 
-    # Get the download URL
-    url = f"https://huggingface.co/{{repo_id}}/resolve/main/{{filename}}"
     headers = {{}}
     token = os.environ.get("HF_TOKEN") or os.environ.get("HUGGING_FACE_HUB_TOKEN")
     if token:
         headers["Authorization"] = f"Bearer {{token}}"
 
-    resp = requests.get(url, headers=headers, stream=True, allow_redirects=True)
-    resp.raise_for_status()
-    total = int(resp.headers.get("content-length", 0))
+    # Pin the download to the file's current revision. The partial file is
+    # keyed by the file's etag, so a resume never splices bytes from two
+    # revisions, and the finished blob lands where hf_hub_download expects it.
+    meta = get_hf_file_metadata(hf_hub_url(repo_id, filename), token=token or None)
+    etag = meta.etag
+    url = hf_hub_url(repo_id, filename, revision=meta.commit_hash or "main")
 
     hub_dir = constants.HF_HUB_CACHE
     folder = os.path.join(hub_dir, "models--" + repo_id.replace("/", "--"))
     blobs_dir = os.path.join(folder, "blobs")
     os.makedirs(blobs_dir, exist_ok=True)
 
-    tmp_path = os.path.join(blobs_dir, filename.replace("/", "_") + ".downloading")
-    received = 0
+    # Drop partials of this file left by an older revision.
+    safe_name = filename.replace("/", "_")
+    tmp_name = f"{{safe_name}}.{{etag}}.downloading"
+    tmp_path = os.path.join(blobs_dir, tmp_name)
+    stale = re.compile(re.escape(safe_name) + r"(\.[0-9a-f]+)?\.downloading")
+    for entry in os.scandir(blobs_dir):
+        if entry.name != tmp_name and stale.fullmatch(entry.name):
+            os.remove(entry.path)
+
+    # Resume an interrupted download from the partial file's current size.
+    received = os.path.getsize(tmp_path) if os.path.isfile(tmp_path) else 0
+    if received:
+        headers["Range"] = f"bytes={{received}}-"
+
+    resp = requests.get(url, headers=headers, stream=True, allow_redirects=True)
+    if received and resp.status_code == 416:
+        # Partial file is stale or oversized for the current upstream file
+        resp.close()
+        headers.pop("Range")
+        received = 0
+        resp = requests.get(url, headers=headers, stream=True, allow_redirects=True)
+    resp.raise_for_status()
+    if resp.status_code != 206:
+        received = 0
+    remaining = int(resp.headers.get("content-length", 0))
+    total = received + remaining if remaining else 0
     last_pct = -1
 
-    with open(tmp_path, "wb") as f:
+    # Hash while streaming so the finished file is not read back a second
+    # time; a resumed partial is hashed once before new bytes are appended.
+    sha = hashlib.sha256()
+    if received:
+        with open(tmp_path, "rb") as f:
+            while True:
+                data = f.read(1024 * 1024)
+                if not data: break
+                sha.update(data)
+
+    with open(tmp_path, "ab" if received else "wb") as f:
         for chunk in resp.iter_content(chunk_size=1024 * 1024):
             f.write(chunk)
+            sha.update(chunk)
             received += len(chunk)
             if total > 0:
                 pct = int(received * 100 / total)
@@ -750,14 +786,15 @@ try:
                     report(received / total, f"{{short}} {{fmt_size(received)}}/{{fmt_size(total)}}")
                     last_pct = pct
 
-    # Hash and place in blobs
-    sha = hashlib.sha256()
-    with open(tmp_path, "rb") as f:
-        while True:
-            data = f.read(1024 * 1024)
-            if not data: break
-            sha.update(data)
-    blob_path = os.path.join(blobs_dir, sha.hexdigest())
+    # LFS files are addressed by their sha256; never promote a corrupt
+    # partial into blobs/ where nothing would ever clean it up.
+    if len(etag) == 64 and sha.hexdigest() != etag:
+        os.remove(tmp_path)
+        raise RuntimeError(
+            f"Checksum mismatch for {{filename}}; discarded the partial download, please retry"
+        )
+
+    blob_path = os.path.join(blobs_dir, etag)
     os.replace(tmp_path, blob_path)
 
     # Let hf_hub_download finalize cache structure (refs, snapshots)
@@ -802,17 +839,24 @@ def fmt_size(b):
     return f"{{b/1024**3:.2f}}GB"
 
 def cache_bytes(folder):
+    # Polled every second while downloading: scandir entries carry their stat
+    # data on Windows, so this avoids a separate getsize() call per file.
     total = 0
-    if not os.path.isdir(folder):
-        return total
-    for root, _, files in os.walk(folder):
-        for name in files:
-            if name.endswith(".lock"):
-                continue
-            try:
-                total += os.path.getsize(os.path.join(root, name))
-            except OSError:
-                pass
+    pending = [folder]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif not entry.name.endswith(".lock"):
+                        total += entry.stat().st_size
+                except OSError:
+                    pass
     return total
 
 def exception_details(error):
@@ -911,6 +955,7 @@ except Exception as e:
     cmd.args(["-u", "-c", &script])
         .env("HF_HUB_DISABLE_PROGRESS_BARS", "1")
         .env("PYTHONIOENCODING", "utf-8")
+        .stdin(std::process::Stdio::null())
         .stdout(std::process::Stdio::piped())
         .stderr(std::process::Stdio::piped());
     if let Some(token) = crate::read_hf_token() {
@@ -954,7 +999,7 @@ except Exception as e:
                         let mut mgr = mgr_out.lock().await;
                         mgr.set_download_progress(&model_id_clone, pct, &label);
                         drop(mgr);
-                        emit_model_status(&mgr_out, &handle_out).await;
+                        emit_download_progress(&mgr_out, &handle_out).await;
                     }
                     if msg.get("status").and_then(|v| v.as_str()) == Some("error") {
                         let detail = msg
@@ -1166,6 +1211,11 @@ try:
     if token:
         headers["Authorization"] = f"Bearer {{token}}"
 
+    # One pooled session keeps the TLS connection to huggingface.co alive
+    # across files instead of reconnecting for every small config/tokenizer.
+    session = requests.Session()
+    session.headers.update(headers)
+
     for i, (filename, file_size) in enumerate(file_entries):
         # Determine output path
         if prefix_filter:
@@ -1183,7 +1233,7 @@ try:
         if file_size < 5 * 1024 * 1024:
             report(completed_bytes / max(total_bytes, 1), f"{{short}} ({{fmt_size(file_size)}})")
             url = f"https://huggingface.co/{{repo_id}}/resolve/main/{{filename}}"
-            resp = requests.get(url, headers=headers, allow_redirects=True)
+            resp = session.get(url, allow_redirects=True)
             resp.raise_for_status()
             with open(out_path, "wb") as f:
                 f.write(resp.content)
@@ -1193,7 +1243,7 @@ try:
 
         # Large files: stream with progress
         url = f"https://huggingface.co/{{repo_id}}/resolve/main/{{filename}}"
-        resp = requests.get(url, headers=headers, stream=True, allow_redirects=True)
+        resp = session.get(url, stream=True, allow_redirects=True)
         resp.raise_for_status()
 
         received = 0
@@ -1229,6 +1279,7 @@ except Exception as e:
     cmd.args(["-u", "-c", &script])
         .env("HF_HUB_DISABLE_PROGRESS_BARS", "1")
         .env("PYTHONIOENCODING", "utf-8")
+        .stdin(std::process::Stdio::null())
         .stdout(std::process::Stdio::piped())
         .stderr(std::process::Stdio::piped());
     if let Some(token) = crate::read_hf_token() {
@@ -1261,7 +1312,7 @@ except Exception as e:
                         let mut mgr = mgr_out.lock().await;
                         mgr.set_download_progress(&model_id_clone, pct, &label);
                         drop(mgr);
-                        emit_model_status(&mgr_out, &handle_out).await;
+                        emit_download_progress(&mgr_out, &handle_out).await;
                     }
                 }
             }
@@ -1367,6 +1418,11 @@ try:
     if token:
         headers["Authorization"] = f"Bearer {{token}}"
 
+    # One pooled session keeps the TLS connection to huggingface.co alive
+    # across files instead of reconnecting for every small config/tokenizer.
+    session = requests.Session()
+    session.headers.update(headers)
+
     for i, (filename, file_size) in enumerate(file_entries):
         out_path = os.path.join(model_dir, filename)
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
@@ -1381,7 +1437,7 @@ try:
         if file_size < 5 * 1024 * 1024:
             report(completed_bytes / max(total_bytes, 1), f"{{filename}} ({{fmt_size(file_size)}})")
             url = f"https://huggingface.co/{{repo_id}}/resolve/main/{{filename}}"
-            resp = requests.get(url, headers=headers, allow_redirects=True)
+            resp = session.get(url, allow_redirects=True)
             resp.raise_for_status()
             with open(out_path, "wb") as f:
                 f.write(resp.content)
@@ -1391,7 +1447,7 @@ try:
 
         # Large files: stream with progress
         url = f"https://huggingface.co/{{repo_id}}/resolve/main/{{filename}}"
-        resp = requests.get(url, headers=headers, stream=True, allow_redirects=True)
+        resp = session.get(url, stream=True, allow_redirects=True)
         resp.raise_for_status()
 
         received = 0
@@ -1423,6 +1479,7 @@ except Exception as e:
     cmd.args(["-u", "-c", &script])
         .env("HF_HUB_DISABLE_PROGRESS_BARS", "1")
         .env("PYTHONIOENCODING", "utf-8")
+        .stdin(std::process::Stdio::null())
         .stdout(std::process::Stdio::piped())
         .stderr(std::process::Stdio::piped());
     if let Some(token) = crate::read_hf_token() {
@@ -1455,7 +1512,7 @@ except Exception as e:
                         let mut mgr = mgr_out.lock().await;
                         mgr.set_download_progress(&model_id_clone, pct, &label);
                         drop(mgr);
-                        emit_model_status(&mgr_out, &handle_out).await;
+                        emit_download_progress(&mgr_out, &handle_out).await;
                     }
                 }
             }
@@ -1517,6 +1574,18 @@ pub async fn emit_model_status(manager: &Arc<Mutex<ModelManager>>, handle: &taur
     let _ = handle.emit("download-progress", &progress);
 }
 
+/// Emit only download progress. Model statuses don't change while a download
+/// is in flight, so progress ticks skip rebuilding every service's model list.
+pub async fn emit_download_progress(
+    manager: &Arc<Mutex<ModelManager>>,
+    handle: &tauri::AppHandle,
+) {
+    let progress = manager.lock().await.get_download_progress();
+
+    use tauri::Emitter;
+    let _ = handle.emit("download-progress", &progress);
+}
+
 #[cfg(test)]
 mod tests {
     use super::{friendly_hf_download_error, ModelManager, ModelStatus};
@@ -6,7 +6,7 @@ use std::path::PathBuf;
 use std::process::{Child, Command, Stdio};
 use std::time::{Duration, Instant};
 
-#[derive(Debug, Clone, Serialize)]
+#[derive(Debug, Clone, PartialEq, Serialize)]
 pub struct ServiceInfo {
     pub id: String,
     pub display_name: String,
@@ -19,7 +19,7 @@ pub struct ServiceInfo {
     pub build_status: Option<BuildStatus>,
 }
 
-#[derive(Debug, Clone, Serialize)]
+#[derive(Debug, Clone, PartialEq, Serialize)]
 pub struct BuildStatus {
     pub building: bool,
     pub current_step: usize,
@@ -34,6 +34,7 @@ struct RunningService {
     healthy: bool,
     started_at: Instant,
     last_health_check_at: Option<Instant>,
+    health_probe_in_flight: bool,
 }
 
 pub struct HealthTarget {
@@ -49,6 +50,9 @@ pub struct ServiceManager {
     running: HashMap<String, RunningService>,
     errors: HashMap<String, String>,
     build_statuses: HashMap<String, BuildStatus>,
+    uv_path: Option<String>,
+    python_installed: bool,
+    env_exists: HashMap<String, bool>,
 }
 
 fn health_check_interval(
@@ -68,6 +72,12 @@ fn health_check_interval(
     }
 }
 
+/// Whether something is still accepting connections on a local service port.
+pub fn port_accepting(port: u16) -> bool {
+    let addr = std::net::SocketAddr::from(([127, 0, 0, 1], port));
+    std::net::TcpStream::connect_timeout(&addr, Duration::from_millis(200)).is_ok()
+}
+
 fn is_successful_health_access_log(line: &str) -> bool {
     let lower = line.to_ascii_lowercase();
     if !lower.contains("/health") {
@@ -110,13 +120,21 @@ fn filter_successful_health_access_logs(raw: &str) -> String {
 
 impl ServiceManager {
     pub fn new(services: Vec<ServiceDef>, repo_root: PathBuf) -> Self {
-        Self {
+        let mut manager = Self {
             services,
             repo_root,
             running: HashMap::new(),
             errors: HashMap::new(),
             build_statuses: HashMap::new(),
+            uv_path: None,
+            python_installed: false,
+            env_exists: HashMap::new(),
+        };
+        let ids: Vec<String> = manager.services.iter().map(|s| s.id.clone()).collect();
+        for id in ids {
+            manager.refresh_env_exists(&id);
         }
+        manager
     }
 
     fn service_dir(&self, svc: &ServiceDef) -> PathBuf {
@@ -135,6 +153,17 @@ impl ServiceManager {
         self.services.iter().find(|s| s.id == id)
     }
 
+    /// Re-stat a service's venv interpreter. get_service_info runs on every
+    /// status tick, so it trusts a cached `true` (cleared again by a start
+    /// that finds the interpreter gone) and only re-checks missing venvs.
+    fn refresh_env_exists(&mut self, service_id: &str) {
+        let Some(svc) = self.find_service(service_id) else {
+            return;
+        };
+        let exists = self.python_exe(svc).exists();
+        self.env_exists.insert(service_id.to_string(), exists);
+    }
+
     /// Resolve template variables like ${APPDATA}, ${HF_TOKEN}, ${MODELS_DIR}
     fn resolve_env_var(&self, value: &str) -> String {
         let mut result = value.to_string();
@@ -198,24 +227,33 @@ impl ServiceManager {
     }
 
     /// Update health status for a running service
-    pub fn set_health(&mut self, service_id: &str, healthy: bool) {
-        if let Some(running) = self.running.get_mut(service_id) {
-            running.healthy = healthy;
-        }
+    /// Record a health probe result. Returns whether the service's health changed.
+    pub fn set_health(&mut self, service_id: &str, healthy: bool) -> bool {
+        let Some(running) = self.running.get_mut(service_id) else {
+            return false;
+        };
+        running.health_probe_in_flight = false;
+        let changed = running.healthy != healthy;
+        running.healthy = healthy;
+        changed
     }
 
     /// Get running services that are due for a health check now.
     pub fn take_due_health_targets(&mut self, now: Instant) -> Vec<HealthTarget> {
-        let services = self.services.clone();
         let mut targets = Vec::new();
 
-        for svc in services {
+        for svc in &self.services {
             let Some(health) = svc.health_check.as_ref() else {
                 continue;
             };
             let Some(running) = self.running.get_mut(&svc.id) else {
                 continue;
             };
+            // Probes finish independently; don't stack a second probe on a
+            // service whose previous one is still waiting on its timeout.
+            if running.health_probe_in_flight {
+                continue;
+            }
 
             // Probe quickly while a service is still starting so the UI can
             // turn green as soon as the service reports ready. The manifest's
@@ -232,8 +270,9 @@ impl ServiceManager {
             }
 
             running.last_health_check_at = Some(now);
+            running.health_probe_in_flight = true;
             targets.push(HealthTarget {
-                id: svc.id,
+                id: svc.id.clone(),
                 port: svc.port,
                 endpoint: health.endpoint.clone(),
                 timeout_seconds: health.timeout_seconds.max(1),
@@ -252,11 +291,10 @@ impl ServiceManager {
                 let pid = running.and_then(|r| r.process.id().into());
                 let healthy = running.map(|r| r.healthy).unwrap_or(false);
                 let error = self.errors.get(&svc.id).cloned();
-                let env_exists = self
-                    .env_dir(svc)
-                    .join("Scripts")
-                    .join("python.exe")
-                    .exists();
+                // A venv created outside a build (another instance, a manual
+                // `uv venv`) must still enable start, so misses are re-checked.
+                let env_exists = self.env_exists.get(&svc.id).copied().unwrap_or(false)
+                    || self.python_exe(svc).exists();
 
                 let health_endpoint = svc
                     .health_check
@@ -301,7 +339,9 @@ impl ServiceManager {
         }
 
         let python = self.python_exe(&svc);
-        if !python.exists() {
+        let python_exists = python.exists();
+        self.env_exists.insert(service_id.to_string(), python_exists);
+        if !python_exists {
             return Err(format!(
                 "Python venv not found at {}. Build the environment first.",
                 python.display()
@@ -329,6 +369,7 @@ impl ServiceManager {
         let mut cmd = Command::new(&python);
         cmd.arg(&svc.entry_point)
             .current_dir(&work_dir)
+            .stdin(Stdio::null())
             .stdout(Stdio::from(log_file))
             .stderr(Stdio::from(log_file_err))
             .env("PYTHONIOENCODING", "utf-8")
@@ -421,6 +462,7 @@ impl ServiceManager {
                 healthy: false,
                 started_at: Instant::now(),
                 last_health_check_at: None,
+                health_probe_in_flight: false,
             },
         );
 
@@ -430,13 +472,7 @@ impl ServiceManager {
     pub fn stop(&mut self, service_id: &str) -> Result<(), String> {
         if let Some(mut running) = self.running.remove(service_id) {
             log::info!("Stopping {}", service_id);
-            // Use taskkill /T to kill the entire process tree on Windows.
-            // This ensures subprocesses (e.g. carey_wrapper -> api_server.py) are also killed.
-            let pid = running.process.id();
-            let _ = std::process::Command::new("taskkill")
-                .args(["/T", "/F", "/PID", &pid.to_string()])
-                .creation_flags(0x08000000) // CREATE_NO_WINDOW
-                .output();
+            kill_process_trees(&[running.process.id()]);
             let _ = running.process.wait();
             self.errors.remove(service_id);
             Ok(())
@@ -445,17 +481,56 @@ impl ServiceManager {
         }
     }
 
+    pub fn service_port(&self, service_id: &str) -> Option<u16> {
+        self.find_service(service_id).map(|svc| svc.port)
+    }
+
     pub fn is_running(&self, service_id: &str) -> bool {
         self.running.contains_key(service_id)
     }
 
     pub fn stop_all(&mut self) {
-        let ids: Vec<String> = self.running.keys().cloned().collect();
-        for id in ids {
-            let _ = self.stop(&id);
+        if self.running.is_empty() {
+            return;
+        }
+
+        // Kill every service tree with a single taskkill instead of spawning
+        // one per service, then reap the direct children.
+        let stopped: Vec<(String, RunningService)> = self.running.drain().collect();
+        let pids: Vec<u32> = stopped
+            .iter()
+            .map(|(id, running)| {
+                log::info!("Stopping {}", id);
+                running.process.id()
+            })
+            .collect();
+        kill_process_trees(&pids);
+
+        for (id, mut running) in stopped {
+            let _ = running.process.wait();
+            self.errors.remove(&id);
         }
     }
 
+    /// uv executable resolved by an earlier build this session, if any
+    pub fn cached_uv_path(&self) -> Option<String> {
+        self.uv_path.clone()
+    }
+
+    /// Remember the resolved uv executable so later builds skip the probe
+    pub fn set_uv_path(&mut self, path: &str) {
+        self.uv_path = Some(path.to_string());
+    }
+
+    /// Whether `uv python install 3.11` already succeeded this session
+    pub fn python_installed(&self) -> bool {
+        self.python_installed
+    }
+
+    pub fn set_python_installed(&mut self) {
+        self.python_installed = true;
+    }
+
     /// Get build info needed to launch an async build
     pub fn get_build_info(&self, service_id: &str) -> Result<BuildInfo, String> {
         let svc = self
@@ -495,6 +570,7 @@ impl ServiceManager {
                 error: None,
             },
         );
+        self.refresh_env_exists(service_id);
     }
 
     /// Update build progress
@@ -529,6 +605,7 @@ impl ServiceManager {
                 status.current_step = status.total_steps;
             }
         }
+        self.refresh_env_exists(service_id);
     }
 
     pub fn get_all_build_infos(&self) -> Vec<BuildInfo> {
@@ -636,6 +713,20 @@ impl ServiceManager {
     }
 }
 
+/// Use taskkill /T to kill entire process trees on Windows.
+/// This ensures subprocesses (e.g. carey_wrapper -> api_server.py) are also killed.
+fn kill_process_trees(pids: &[u32]) {
+    let mut args = vec!["/T".to_string(), "/F".to_string()];
+    for pid in pids {
+        args.push("/PID".to_string());
+        args.push(pid.to_string());
+    }
+    let _ = Command::new("taskkill")
+        .args(&args)
+        .creation_flags(0x08000000) // CREATE_NO_WINDOW
+        .output();
+}
+
 pub struct BuildInfo {
     pub service_id: String,
     pub work_dir: PathBuf,
@@ -651,14 +742,14 @@ pub fn install_xformers_shim(env_dir: &PathBuf) -> Result<(), String> {
     std::fs::create_dir_all(&ops_dir)
         .map_err(|e| format!("Cannot create xformers shim dir: {}", e))?;
 
-    std::fs::write(
-        xformers_dir.join("__init__.py"),
+    crate::write_if_changed(
+        &xformers_dir.join("__init__.py"),
         "__version__ = \"0.0.0+sdpa_shim\"\n",
     )
     .map_err(|e| format!("Cannot write xformers __init__.py: {}", e))?;
 
-    std::fs::write(
-        ops_dir.join("__init__.py"),
+    crate::write_if_changed(
+        &ops_dir.join("__init__.py"),
         r#"import torch
 from torch.nn.functional import scaled_dot_product_attention as _sdpa
 
@@ -727,6 +818,41 @@ mod tests {
         );
     }
 
+    #[test]
+    fn venv_created_outside_a_build_is_picked_up() {
+        let root = std::env::temp_dir().join(format!("gary-env-exists-{}", std::process::id()));
+        let _ = std::fs::remove_dir_all(&root);
+        let svc = ServiceDef {
+            id: "svc".to_string(),
+            display_name: "Svc".to_string(),
+            port: 1,
+            entry_point: "main.py".to_string(),
+            working_dir: "svc".to_string(),
+            build_steps: Vec::new(),
+            env: HashMap::new(),
+            health_check: None,
+        };
+        let manager = ServiceManager::new(vec![svc.clone()], root.clone());
+        assert!(!manager.get_service_info()[0].env_exists);
+
+        let python = manager.python_exe(&svc);
+        std::fs::create_dir_all(python.parent().unwrap()).unwrap();
+        std::fs::write(&python, b"").unwrap();
+        assert!(manager.get_service_info()[0].env_exists);
+
+        let _ = std::fs::remove_dir_all(&root);
+    }
+
+    #[test]
+    fn port_accepting_tracks_listener_lifetime() {
+        let listener = std::net::TcpListener::bind("127.0.0.1:0").unwrap();
+        let port = listener.local_addr().unwrap().port();
+        assert!(port_accepting(port));
+
+        drop(listener);
+        assert!(!port_accepting(port));
+    }
+
     #[test]
     fn successful_health_access_logs_are_filtered() {
         let raw = concat!(